@@ -1,148 +1,696 @@
-from flask import Flask, render_template, jsonify, request
-import random
-from collections import deque
+from quart import Quart, render_template, jsonify, request
+import asyncio
 import heapq
+import os
+import queue
+import random
+import threading
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional; the kernels then run as plain Python
+    HAVE_NUMBA = False
 
-app = Flask(__name__)
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+app = Quart(__name__)
 
 # Default maze size (adjustable later)
 ROWS, COLS = 25, 35
 WALL, PATH = 1, 0
 
 def generate_maze():
-    maze = [[WALL for _ in range(COLS)] for _ in range(ROWS)]
+    # carve on plain lists (faster per-cell access than ndarray scalars)
+    # and convert to the uint8 grid once at the end
+    maze = [[WALL] * COLS for _ in range(ROWS)]
 
-    def carve_from(r, c):
-        maze[r][c] = PATH
+    def shuffled_directions():
         directions = [(0,2),(0,-2),(2,0),(-2,0)]
         random.shuffle(directions)
-        for dr, dc in directions:
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < ROWS and 0 <= nc < COLS and maze[nr][nc] == WALL:
-                maze[r + dr//2][c + dc//2] = PATH
-                carve_from(nr, nc)
+        return iter(directions)
+
+    # iterative backtracker: an explicit stack instead of one Python frame
+    # per carved cell, so larger grids don't hit the recursion limit. Each
+    # entry keeps its cell's shuffled directions so a cell is shuffled
+    # once and resumes where it left off.
+    def carve_from(sr, sc):
+        maze[sr][sc] = PATH
+        stack = [(sr, sc, shuffled_directions())]
+        while stack:
+            r, c, directions = stack[-1]
+            for dr, dc in directions:
+                nr, nc = r + dr, c + dc
+                if 0 <= nr < ROWS and 0 <= nc < COLS and maze[nr][nc] == WALL:
+                    maze[r + dr//2][c + dc//2] = PATH
+                    maze[nr][nc] = PATH
+                    stack.append((nr, nc, shuffled_directions()))
+                    break
+            else:
+                stack.pop()
 
     carve_from(0, 0)
     maze[0][0] = PATH
     maze[ROWS-1][COLS-1] = PATH
-    return maze
+    return np.array(maze, dtype=np.uint8)
 
-# BFS that returns exploration order + final path
-def bfs_with_exploration(maze, start, end):
-    ROWS, COLS = len(maze), len(maze[0])
-    q = deque([start])
-    parent = {start: None}
-    explored = []
-    found = False
+# ---------- Search kernels ----------
+# Kernels work on the flattened uint8 maze with cells packed as
+# idx = r*C + c, and return (parent, explored, explored_len). They are
+# compiled with numba when it is installed.
+_INF = 2**31 - 1
+
+@njit(cache=True)
+def _neighbor(cur, k, R, C):
+    # k-th of the 4 neighbors of cur, or -1 if it is off the grid
+    r = cur // C
+    c = cur % C
+    if k == 0:
+        return cur - C if r > 0 else -1
+    if k == 1:
+        return cur + C if r < R - 1 else -1
+    if k == 2:
+        return cur - 1 if c > 0 else -1
+    return cur + 1 if c < C - 1 else -1
 
-    while q:
-        node = q.popleft()
-        explored.append(node)
-        if node == end:
-            found = True
+@njit(cache=True, nogil=True)
+def _bfs_flat(cells, R, C, s_idx, e_idx):
+    N = R * C
+    parent = np.full(N, -1, np.int32)
+    seen = np.zeros(N, np.bool_)
+    # every cell is enqueued at most once, so the queue doubles as the
+    # exploration order
+    queue = np.empty(N, np.int32)
+    queue[0] = s_idx
+    seen[s_idx] = True
+    head, tail = 0, 1
+    while head < tail:
+        cur = queue[head]
+        head += 1
+        if cur == e_idx:
             break
-        r, c = node
-        for dr, dc in [(1,0),(-1,0),(0,1),(0,-1)]:
-            nr, nc = r+dr, c+dc
-            n = (nr, nc)
-            if 0 <= nr < ROWS and 0 <= nc < COLS and maze[nr][nc] == PATH and n not in parent:
-                parent[n] = node
-                q.append(n)
-
-    # reconstruct path
-    path = []
-    if found:
-        cur = end
-        while cur is not None:
-            path.append(cur)
-            cur = parent[cur]
-        path.reverse()
-    return explored, path
+        for k in range(4):
+            nb = _neighbor(cur, k, R, C)
+            if nb < 0 or seen[nb] or cells[nb] != PATH:
+                continue
+            seen[nb] = True
+            parent[nb] = cur
+            queue[tail] = nb
+            tail += 1
+    return parent, queue, head
 
-# A* that returns exploration order + final path
-def manhattan(a, b):
-    return abs(a[0]-b[0]) + abs(a[1]-b[1])
+# Indexed binary heap. Each entry packs its priority, heuristic and cell
+# into one int64, (f << 40) | (h << 20) | idx, so ordering is a single
+# integer compare and ties on f go to the cell nearer the goal. Needs
+# R*C <= 2**20. pos[idx] is the heap slot of cell idx, or one of the
+# markers below, so every cell has at most one entry and an improved key
+# is a decrease-key rather than a second push.
+_UNSEEN, _CLOSED = -1, -2
+_KEY_BITS = 20
+_IDX_MASK = (1 << _KEY_BITS) - 1
 
-def astar_with_exploration(maze, start, end):
-    ROWS, COLS = len(maze), len(maze[0])
-    gscore = {start: 0}
-    fscore = {start: manhattan(start, end)}
-    parent = {}
-    open_heap = []
-    heapq.heappush(open_heap, (fscore[start], start))
-    open_set = {start}
-    closed = set()
-    explored = []
+@njit(cache=True)
+def _heap_swap(heap, pos, a, b):
+    heap[a], heap[b] = heap[b], heap[a]
+    pos[heap[a] & _IDX_MASK] = a
+    pos[heap[b] & _IDX_MASK] = b
 
-    while open_heap:
-        _, current = heapq.heappop(open_heap)
-        if current in closed:
+@njit(cache=True)
+def _sift_up(heap, pos, i):
+    while i > 0:
+        up = (i - 1) // 2
+        if heap[i] >= heap[up]:
+            break
+        _heap_swap(heap, pos, i, up)
+        i = up
+
+@njit(cache=True)
+def _sift_down(heap, pos, i, size):
+    while True:
+        child = 2*i + 1
+        if child >= size:
+            break
+        if child + 1 < size and heap[child + 1] < heap[child]:
+            child += 1
+        if heap[child] >= heap[i]:
+            break
+        _heap_swap(heap, pos, i, child)
+        i = child
+
+@njit(cache=True)
+def _heap_push_or_decrease(heap, pos, size, f, h, idx):
+    # returns the new heap size
+    key = (np.int64(f) << 2*_KEY_BITS) | (np.int64(h) << _KEY_BITS) | idx
+    slot = pos[idx]
+    if slot >= 0:
+        if key < heap[slot]:
+            heap[slot] = key
+            _sift_up(heap, pos, slot)
+        return size
+    heap[size] = key
+    pos[idx] = size
+    _sift_up(heap, pos, size)
+    return size + 1
+
+@njit(cache=True)
+def _heap_pop(heap, pos, size):
+    # pops the smallest cell and marks it closed; returns (idx, new size)
+    top = heap[0] & _IDX_MASK
+    pos[top] = _CLOSED
+    size -= 1
+    if size > 0:
+        heap[0] = heap[size]
+        pos[heap[0] & _IDX_MASK] = 0
+        _sift_down(heap, pos, 0, size)
+    return top, size
+
+@njit(cache=True, nogil=True)
+def _astar_flat(cells, R, C, s_idx, e_idx):
+    N = R * C
+    er = e_idx // C
+    ec = e_idx % C
+    gscore = np.full(N, _INF, np.int32)
+    parent = np.full(N, -1, np.int32)
+    # heuristic is fixed for the query, so compute each cell's h at most once
+    h_cache = np.full(N, -1, np.int32)
+    explored = np.empty(N, np.int32)
+    n_explored = 0
+    heap = np.empty(N, np.int64)
+    pos = np.full(N, _UNSEEN, np.int32)
+    gscore[s_idx] = 0
+    h = abs(s_idx // C - er) + abs(s_idx % C - ec)
+    size = _heap_push_or_decrease(heap, pos, 0, h, h, s_idx)
+
+    while size > 0:
+        current, size = _heap_pop(heap, pos, size)
+        explored[n_explored] = current
+        n_explored += 1
+
+        if current == e_idx:
+            break
+
+        tentative_g = gscore[current] + 1
+        for k in range(4):
+            nb = _neighbor(current, k, R, C)
+            if nb < 0 or cells[nb] == WALL or pos[nb] == _CLOSED:
+                continue
+            if tentative_g < gscore[nb]:
+                parent[nb] = current
+                gscore[nb] = tentative_g
+                h = h_cache[nb]
+                if h < 0:
+                    h = abs(nb // C - er) + abs(nb % C - ec)
+                    h_cache[nb] = h
+                size = _heap_push_or_decrease(heap, pos, size, tentative_g + h, h, nb)
+    return parent, explored, n_explored
+
+@njit(cache=True)
+def _bidir_step(cells, R, C, heap, pos, size, g, parent, h_to, h_from,
+                sr, sc, tr, tc, g_other, mu, meet):
+    # Expand one node of a single direction of the bidirectional search,
+    # which runs from (sr, sc) towards (tr, tc). h_to / h_from cache the
+    # heuristic to its target and back to its source.
+    # Returns (size, expanded node, mu, meet).
+    current, size = _heap_pop(heap, pos, size)
+
+    tentative_g = g[current] + 1
+    for k in range(4):
+        nb = _neighbor(current, k, R, C)
+        if nb < 0 or cells[nb] == WALL or pos[nb] == _CLOSED:
             continue
-        open_set.discard(current)
-        closed.add(current)
-        explored.append(current)
+        if tentative_g < g[nb]:
+            parent[nb] = current
+            g[nb] = tentative_g
+            if h_to[nb] < 0:
+                r = nb // C
+                c = nb % C
+                h_to[nb] = abs(r - tr) + abs(c - tc)
+                h_from[nb] = abs(r - sr) + abs(c - sc)
+            size = _heap_push_or_decrease(heap, pos, size,
+                                          2*tentative_g + h_to[nb] - h_from[nb],
+                                          h_to[nb], nb)
+            # the two searches touch here: candidate start->nb->end path
+            if g_other[nb] != _INF and tentative_g + g_other[nb] < mu:
+                mu = tentative_g + g_other[nb]
+                meet = nb
+    return size, current, mu, meet
 
-        if current == end:
+@njit(cache=True, nogil=True)
+def _bidir_astar_flat(cells, R, C, s_idx, e_idx):
+    N = R * C
+    sr, sc = s_idx // C, s_idx % C
+    er, ec = e_idx // C, e_idx % C
+    g_f = np.full(N, _INF, np.int32)
+    g_r = np.full(N, _INF, np.int32)
+    parent_f = np.full(N, -1, np.int32)
+    parent_r = np.full(N, -1, np.int32)
+    # Average potential p(v) = (h_end(v) - h_start(v)) / 2, kept doubled so
+    # keys stay integral: forward keys are 2g + p2, reverse keys 2g - p2.
+    # Both directions then see the same reduced edge costs, which is what
+    # makes the sum-of-tops stopping rule below exact.
+    h_end = np.full(N, -1, np.int32)
+    h_start = np.full(N, -1, np.int32)
+    heap_f = np.empty(N, np.int64)
+    pos_f = np.full(N, _UNSEEN, np.int32)
+    heap_r = np.empty(N, np.int64)
+    pos_r = np.full(N, _UNSEEN, np.int32)
+    explored = np.empty(2*N, np.int32)
+    n_explored = 0
+
+    d = abs(sr - er) + abs(sc - ec)
+    g_f[s_idx] = 0
+    size_f = _heap_push_or_decrease(heap_f, pos_f, 0, d, d, s_idx)
+    g_r[e_idx] = 0
+    size_r = _heap_push_or_decrease(heap_r, pos_r, 0, d, d, e_idx)
+    mu = _INF
+    meet = -1
+    if s_idx == e_idx:
+        mu = 0
+        meet = s_idx
+
+    forward = True
+    while size_f > 0 and size_r > 0:
+        if (heap_f[0] >> 2*_KEY_BITS) + (heap_r[0] >> 2*_KEY_BITS) >= 2*mu:
+            break
+        if forward:
+            size_f, node, mu, meet = _bidir_step(
+                cells, R, C, heap_f, pos_f, size_f, g_f, parent_f,
+                h_end, h_start, sr, sc, er, ec, g_r, mu, meet)
+        else:
+            size_r, node, mu, meet = _bidir_step(
+                cells, R, C, heap_r, pos_r, size_r, g_r, parent_r,
+                h_start, h_end, er, ec, sr, sc, g_f, mu, meet)
+        explored[n_explored] = node
+        n_explored += 1
+        forward = not forward
+    return parent_f, parent_r, meet, explored, n_explored
+
+@njit(cache=True)
+def _walk_parents(parent, start_idx, end_idx):
+    # cells from start_idx to end_idx along parent links, or an empty
+    # array if end_idx was never reached from start_idx
+    path = np.empty(parent.shape[0], np.int32)
+    n = 0
+    cur = end_idx
+    while cur != start_idx:
+        path[n] = cur
+        n += 1
+        cur = parent[cur]
+        if cur == -1:
+            return path[:0]
+    path[n] = start_idx
+    n += 1
+    return path[:n][::-1]
+
+def _warm_kernels():
+    # compile on a tiny grid at startup so the first /solve isn't billed
+    cells = np.zeros(16, dtype=np.uint8)
+    _bfs_flat(cells, 4, 4, 0, 15)
+    parent = _astar_flat(cells, 4, 4, 0, 15)[0]
+    _bidir_astar_flat(cells, 4, 4, 0, 15)
+    _walk_parents(parent, 0, 15)
+
+def _flat_endpoints(maze, start, end):
+    # start/end come from the client and the kernels do no bounds checks,
+    # so an out-of-range cell must be rejected before it becomes an index
+    ROWS, COLS = maze.shape
+    for name, (r, c) in (("start", start), ("end", end)):
+        if not (0 <= r < ROWS and 0 <= c < COLS):
+            raise ValueError(f"{name} {(r, c)} is outside the {ROWS}x{COLS} maze")
+    return start[0]*COLS + start[1], end[0]*COLS + end[1]
+
+def _run_kernel(kernel, maze, start, end):
+    ROWS, COLS = maze.shape
+    cells = np.ascontiguousarray(maze, dtype=np.uint8).reshape(-1)
+    start_idx, end_idx = _flat_endpoints(maze, start, end)
+    parent, explored, n_explored = kernel(cells, ROWS, COLS, start_idx, end_idx)
+    return explored[:n_explored], _walk_parents(parent, start_idx, end_idx)
+
+# ---------- Pure-Python fallbacks ----------
+# Used when numba is missing: the kernels above would run interpreted on
+# NumPy scalars, which is slower than plain lists. Same flat indices and
+# return convention (parent, explored), here as lists.
+def _bfs_py(cells, R, C, s_idx, e_idx):
+    parent = [-1] * (R*C)
+    seen = bytearray(R*C)
+    seen[s_idx] = 1
+    frontier = deque([s_idx])
+    explored = []
+    while frontier:
+        cur = frontier.popleft()
+        explored.append(cur)
+        if cur == e_idx:
             break
+        r, c = divmod(cur, C)
+        for ok, nb in ((r > 0, cur - C), (r < R-1, cur + C),
+                       (c > 0, cur - 1), (c < C-1, cur + 1)):
+            if ok and not seen[nb] and cells[nb] == PATH:
+                seen[nb] = 1
+                parent[nb] = cur
+                frontier.append(nb)
+    return parent, explored
 
-        r, c = current
-        for dr, dc in [(1,0),(-1,0),(0,1),(0,-1)]:
-            nr, nc = r+dr, c+dc
-            neighbor = (nr, nc)
-            if not (0 <= nr < ROWS and 0 <= nc < COLS):
+def _astar_py(cells, R, C, s_idx, e_idx):
+    N = R*C
+    er, ec = divmod(e_idx, C)
+    gscore = [_INF] * N
+    parent = [-1] * N
+    closed = bytearray(N)
+    h_cache = [-1] * N
+    gscore[s_idx] = 0
+    sr, sc = divmod(s_idx, C)
+    h = abs(sr - er) + abs(sc - ec)
+    open_heap = [(h << 2*_KEY_BITS) | (h << _KEY_BITS) | s_idx]
+    explored = []
+    while open_heap:
+        cur = heapq.heappop(open_heap) & _IDX_MASK
+        if closed[cur]:
+            continue
+        closed[cur] = 1
+        explored.append(cur)
+        if cur == e_idx:
+            break
+        r, c = divmod(cur, C)
+        tentative_g = gscore[cur] + 1
+        for ok, nb in ((r > 0, cur - C), (r < R-1, cur + C),
+                       (c > 0, cur - 1), (c < C-1, cur + 1)):
+            if not ok or cells[nb] == WALL or closed[nb]:
                 continue
-            if maze[nr][nc] == WALL:
+            if tentative_g < gscore[nb]:
+                parent[nb] = cur
+                gscore[nb] = tentative_g
+                h = h_cache[nb]
+                if h < 0:
+                    nr, nc = divmod(nb, C)
+                    h = h_cache[nb] = abs(nr - er) + abs(nc - ec)
+                heapq.heappush(open_heap,
+                               ((tentative_g + h) << 2*_KEY_BITS) | (h << _KEY_BITS) | nb)
+    return parent, explored
+
+def _bidir_astar_py(cells, R, C, s_idx, e_idx):
+    # same search as _bidir_astar_flat; stale heap entries are skipped
+    # lazily, so both tops are cleaned before the stopping check
+    N = R*C
+    sr, sc = divmod(s_idx, C)
+    er, ec = divmod(e_idx, C)
+    g_f, g_r = [_INF] * N, [_INF] * N
+    parent_f, parent_r = [-1] * N, [-1] * N
+    closed_f, closed_r = bytearray(N), bytearray(N)
+    h_end, h_start = [-1] * N, [-1] * N
+    d = abs(sr - er) + abs(sc - ec)
+    g_f[s_idx] = 0
+    heap_f = [(d << 2*_KEY_BITS) | (d << _KEY_BITS) | s_idx]
+    g_r[e_idx] = 0
+    heap_r = [(d << 2*_KEY_BITS) | (d << _KEY_BITS) | e_idx]
+    mu, meet = (0, s_idx) if s_idx == e_idx else (_INF, -1)
+    # per direction: heap, g, parent, closed, h to target / from source,
+    # source, target, and the other direction's g
+    sides = ((heap_f, g_f, parent_f, closed_f, h_end, h_start, sr, sc, er, ec, g_r),
+             (heap_r, g_r, parent_r, closed_r, h_start, h_end, er, ec, sr, sc, g_f))
+    explored = []
+    side = 0
+    while True:
+        while heap_f and closed_f[heap_f[0] & _IDX_MASK]:
+            heapq.heappop(heap_f)
+        while heap_r and closed_r[heap_r[0] & _IDX_MASK]:
+            heapq.heappop(heap_r)
+        if not heap_f or not heap_r:
+            break
+        if (heap_f[0] >> 2*_KEY_BITS) + (heap_r[0] >> 2*_KEY_BITS) >= 2*mu:
+            break
+        heap, g, parent, closed, h_to, h_from, fr, fc, tr, tc, g_other = sides[side]
+        cur = heapq.heappop(heap) & _IDX_MASK
+        closed[cur] = 1
+        explored.append(cur)
+        r, c = divmod(cur, C)
+        tentative_g = g[cur] + 1
+        for ok, nb in ((r > 0, cur - C), (r < R-1, cur + C),
+                       (c > 0, cur - 1), (c < C-1, cur + 1)):
+            if not ok or cells[nb] == WALL or closed[nb]:
                 continue
-            tentative_g = gscore[current] + 1
-            if tentative_g < gscore.get(neighbor, float('inf')):
-                parent[neighbor] = current
-                gscore[neighbor] = tentative_g
-                fscore[neighbor] = tentative_g + manhattan(neighbor, end)
-                if neighbor not in open_set and neighbor not in closed:
-                    heapq.heappush(open_heap, (fscore[neighbor], neighbor))
-                    open_set.add(neighbor)
-
-    # reconstruct path
-    path = []
-    if end in parent or start == end:
-        cur = end
-        # include end even if it's start
-        while cur is not None:
-            path.append(cur)
-            cur = parent.get(cur, None)
-            if cur == start and start not in path:
-                path.append(start)
-                break
-        path.reverse()
-        # ensure start included if missing
-        if path and path[0] != start:
-            path.insert(0, start)
+            if tentative_g < g[nb]:
+                parent[nb] = cur
+                g[nb] = tentative_g
+                h = h_to[nb]
+                if h < 0:
+                    nr, nc = divmod(nb, C)
+                    h = h_to[nb] = abs(nr - tr) + abs(nc - tc)
+                    h_from[nb] = abs(nr - fr) + abs(nc - fc)
+                f = 2*tentative_g + h - h_from[nb]
+                heapq.heappush(heap, (f << 2*_KEY_BITS) | (h << _KEY_BITS) | nb)
+                if g_other[nb] != _INF and tentative_g + g_other[nb] < mu:
+                    mu = tentative_g + g_other[nb]
+                    meet = nb
+        side ^= 1
+    return parent_f, parent_r, meet, explored
+
+def _walk_parents_py(parent, start_idx, end_idx):
+    path = [end_idx]
+    cur = end_idx
+    while cur != start_idx:
+        cur = parent[cur]
+        if cur == -1:
+            return []
+        path.append(cur)
+    path.reverse()
+    return path
+
+def _run_py(search, maze, start, end):
+    ROWS, COLS = maze.shape
+    cells = np.ascontiguousarray(maze, dtype=np.uint8).tobytes()
+    start_idx, end_idx = _flat_endpoints(maze, start, end)
+    parent, explored = search(cells, ROWS, COLS, start_idx, end_idx)
+    path = _walk_parents_py(parent, start_idx, end_idx)
+    return np.array(explored, dtype=np.int32), np.array(path, dtype=np.int32)
+
+# The searches below return (explored, path) as int32 arrays of flat cell
+# indices r*COLS + c, in exploration order and start-to-end order.
+
+# BFS that returns exploration order + final path. bitset=True picks the
+# level-at-a-time search below instead of the per-cell queue.
+def bfs_with_exploration(maze, start, end, bitset=False):
+    if bitset:
+        return _bfs_levels(maze, start, end)
+    if HAVE_NUMBA:
+        return _run_kernel(_bfs_flat, maze, start, end)
+    return _run_py(_bfs_py, maze, start, end)
+
+# Level-at-a-time BFS with no per-cell Python loop in the expansion. Each
+# maze row is bit-packed into uint64 words (bit c%64 of word c//64 is
+# column c), so a frontier step is a handful of shift/and/or ops over 64
+# cells at a time, but every step also costs a pass over the whole grid.
+# That only pays off when frontiers are hundreds of cells wide: on large
+# open grids (300x300 and up) it roughly breaks even with _bfs_py, while
+# on backtracker mazes (a few cells per level) it is 10x+ slower. Hence
+# opt-in, never the default. `explored` comes out grouped by level.
+_U1, _U63 = np.uint64(1), np.uint64(63)
+
+def _pack_rows(mask):
+    ROWS, COLS = mask.shape
+    words = (COLS + 63) // 64
+    padded = np.zeros((ROWS, words * 64), dtype=bool)
+    padded[:, :COLS] = mask
+    return np.packbits(padded, axis=1, bitorder="little").view("<u8")
+
+def _set_cells(bits, cols):
+    # flat indices of the set bits; only non-empty words are unpacked
+    rows, words = np.nonzero(bits)
+    set_bits = np.unpackbits(bits[rows, words].view(np.uint8).reshape(-1, 8),
+                             axis=1, bitorder="little")
+    k, bit = np.nonzero(set_bits)
+    return rows[k]*cols + words[k]*64 + bit
+
+def _bfs_levels(maze, start, end):
+    ROWS, COLS = maze.shape
+    start_idx, end_idx = _flat_endpoints(maze, start, end)
+    open_bits = _pack_rows(maze == PATH)
+    frontier = np.zeros_like(open_bits)
+    frontier[start[0], start[1] >> 6] = _U1 << np.uint64(start[1] & 63)
+    visited = frontier.copy()
+    # BFS level of every reached cell, filled from each frontier
+    dist = np.full(ROWS * COLS, -1, dtype=np.int32)
+    dist[start_idx] = 0
+    explored = np.empty(ROWS * COLS, dtype=np.int32)
+    explored[0] = start_idx
+    n_explored = 1
+    level = 0
+
+    while dist[end_idx] < 0 and frontier.any():
+        nxt = np.zeros_like(frontier)
+        nxt[1:] |= frontier[:-1]
+        nxt[:-1] |= frontier[1:]
+        # east/west: shift within each word, carrying the edge bit across
+        # neighbouring words of the same row
+        nxt |= frontier << _U1
+        nxt[:, 1:] |= frontier[:, :-1] >> _U63
+        nxt |= frontier >> _U1
+        nxt[:, :-1] |= frontier[:, 1:] << _U63
+        nxt &= open_bits & ~visited
+        visited |= nxt
+        level += 1
+        cells = _set_cells(nxt, COLS)
+        dist[cells] = level
+        explored[n_explored:n_explored + len(cells)] = cells
+        n_explored += len(cells)
+        frontier = nxt
+
+    # reconstruct path by stepping down the BFS levels
+    path = np.empty(max(dist[end_idx] + 1, 0), dtype=np.int32)
+    if dist[end_idx] >= 0:
+        idx = end_idx
+        path[-1] = idx
+        for d in range(dist[end_idx] - 1, -1, -1):
+            r, c = divmod(idx, COLS)
+            if r > 0 and dist[idx - COLS] == d:
+                idx -= COLS
+            elif r < ROWS-1 and dist[idx + COLS] == d:
+                idx += COLS
+            elif c > 0 and dist[idx - 1] == d:
+                idx -= 1
+            else:
+                idx += 1
+            path[d] = idx
+    return explored[:n_explored], path
+
+def _check_key_range(maze):
+    # heap keys keep the cell index in their low _KEY_BITS bits
+    if maze.size > 1 << _KEY_BITS:
+        raise ValueError(f"maze too large for A*: {maze.size} cells "
+                         f"(max {1 << _KEY_BITS})")
+
+# A* that returns exploration order + final path
+def astar_with_exploration(maze, start, end):
+    _check_key_range(maze)
+    if HAVE_NUMBA:
+        return _run_kernel(_astar_flat, maze, start, end)
+    return _run_py(_astar_py, maze, start, end)
+
+# Bidirectional A*: forward and reverse searches alternate and stop once
+# they have met on a provably shortest path.
+def bidirectional_astar_with_exploration(maze, start, end):
+    _check_key_range(maze)
+    ROWS, COLS = maze.shape
+    start_idx, end_idx = _flat_endpoints(maze, start, end)
+    if HAVE_NUMBA:
+        cells = np.ascontiguousarray(maze, dtype=np.uint8).reshape(-1)
+        parent_f, parent_r, meet, explored, n_explored = _bidir_astar_flat(
+            cells, ROWS, COLS, start_idx, end_idx)
+        explored = explored[:n_explored]
+        walk = _walk_parents
+    else:
+        cells = np.ascontiguousarray(maze, dtype=np.uint8).tobytes()
+        parent_f, parent_r, meet, explored = _bidir_astar_py(
+            cells, ROWS, COLS, start_idx, end_idx)
+        explored = np.array(explored, dtype=np.int32)
+        walk = _walk_parents_py
+
+    path = np.empty(0, np.int32)
+    if meet != -1:
+        # start -> meet on the forward tree, then meet -> end on the reverse one
+        head = walk(parent_f, start_idx, meet)
+        tail = walk(parent_r, end_idx, meet)[::-1]
+        path = np.concatenate((head, tail[1:])).astype(np.int32)
     return explored, path
 
+# /solve's "algo" values
+SEARCHES = {
+    "bfs": bfs_with_exploration,
+    "astar": astar_with_exploration,
+    "bidir": bidirectional_astar_with_exploration,
+}
+
+# /solve runs searches on this pool so the event loop stays free to serve
+# other requests meanwhile. Threads rather than processes: a solve takes
+# well under a millisecond, less than shipping the maze to another process.
+# Searches only run in parallel when the numba kernels are used (they drop
+# the GIL); the pure-Python fallbacks hold it, so there the pool just
+# keeps the loop responsive.
+POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
 @app.route("/")
-def index():
-    return render_template("index.html")
+async def index():
+    return await render_template("index.html")
+
+# Recently generated mazes by id, so /solve can refer to one instead of
+# re-sending the grid. Least recently used entries are dropped first.
+MAZE_CACHE = OrderedDict()
+MAZE_CACHE_SIZE = 128
+
+def cache_maze(maze):
+    maze_id = uuid.uuid4().hex
+    MAZE_CACHE[maze_id] = maze
+    if len(MAZE_CACHE) > MAZE_CACHE_SIZE:
+        MAZE_CACHE.popitem(last=False)
+    return maze_id
+
+def cached_maze(maze_id):
+    maze = MAZE_CACHE.get(maze_id)
+    if maze is not None:
+        MAZE_CACHE.move_to_end(maze_id)
+    return maze
+
+# Mazes generated ahead of time by a background thread, so /generate
+# usually just takes one instead of carving it inside the request.
+# Nothing in the app forks (POOL is threads), which is what makes a
+# long-lived thread safe here: forking while it holds the queue's lock
+# would deadlock the child. Any process pool added later needs a
+# "spawn" or "forkserver" context.
+MAZE_POOL = queue.Queue(maxsize=8)
+
+def _maze_producer():
+    while True:
+        MAZE_POOL.put(generate_maze())  # blocks while the pool is full
+
+@app.before_serving
+async def start_maze_producer():
+    threading.Thread(target=_maze_producer, daemon=True).start()
 
 @app.route("/generate")
-def generate():
-    maze = generate_maze()
-    return jsonify(maze)
+async def generate():
+    try:
+        maze = MAZE_POOL.get_nowait()
+    except queue.Empty:
+        maze = generate_maze()
+    return jsonify({"id": cache_maze(maze), "maze": maze.tolist()})
 
 @app.route("/solve", methods=["POST"])
-def solve():
-    data = request.json
-    maze = data.get("maze")
+async def solve():
+    data = await request.get_json()
+    maze = cached_maze(data.get("maze_id"))
+    if maze is None:
+        if data.get("maze") is None:
+            # unknown or evicted id; the client retries with the full grid
+            return jsonify({"error": "unknown maze_id"}), 404
+        maze = np.asarray(data.get("maze"), dtype=np.uint8)
     start = tuple(data.get("start", (0,0)))
-    end = tuple(data.get("end", (len(maze)-1, len(maze[0])-1)))
+    end = tuple(data.get("end", (maze.shape[0]-1, maze.shape[1]-1)))
     algo = data.get("algo", "astar")
-    if algo == "bfs":
-        explored, path = bfs_with_exploration(maze, start, end)
-    else:
-        explored, path = astar_with_exploration(maze, start, end)
-    # Convert tuples to lists for JSON
-    explored_list = [[r,c] for (r,c) in explored]
-    path_list = [[r,c] for (r,c) in path]
-    return jsonify({"explored": explored_list, "path": path_list})
+    search = SEARCHES.get(algo, astar_with_exploration)
+    loop = asyncio.get_running_loop()
+    try:
+        explored, path = await loop.run_in_executor(POOL, search, maze, start, end)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    # Send cells as parallel row/column arrays rather than [[r, c], ...]
+    explored_r, explored_c = np.divmod(explored, maze.shape[1])
+    path_r, path_c = np.divmod(path, maze.shape[1])
+    return jsonify({
+        "explored_r": explored_r.tolist(),
+        "explored_c": explored_c.tolist(),
+        "path_r": path_r.tolist(),
+        "path_c": path_c.tolist(),
+    })
+
+# Runs on import, so every server worker starts warm.
+if HAVE_NUMBA:
+    _warm_kernels()
 
 if __name__ == "__main__":
     app.run(debug=True)
@@ -5,17 +5,23 @@ Interactive Maze Solver with Tkinter
 - Click to toggle walls
 - Right-click to set Start/End (first right-click = Start, second = End, then toggles)
 - Solve with BFS or A* (animated)
-- Speed control slider
+- Speed control slider, Stop button to cancel a running search
 
 Run: python maze_solver_ui.py
 """
 
 import tkinter as tk
-from tkinter import ttk
+from tkinter import ttk, messagebox
 import random
 import time
 import heapq
 from collections import deque
+import numpy as np
+
+try:
+    from PIL import Image, ImageTk  # optional, faster image uploads
+except ImportError:
+    Image = ImageTk = None
 
 # ---------- Config ----------
 ROWS = 25
@@ -33,8 +39,18 @@ COLOR_VISITED = "lightblue"
 COLOR_FRONTIER = "cyan"
 COLOR_FINAL_PATH = "yellow"
 
+# Animation frames: redraw after this many dirty cells or ~16 ms (60 fps)
+FRAME_BATCH = 16
+FRAME_TIME = 0.016
+
+# A* heap entries are single ints (f << 40) | (h << 20) | (r*COLS + c):
+# one int compare per heap step, no tuple per push, and ties on f go to the
+# cell nearer the goal. Needs ROWS*COLS < 2**20.
+_KEY_BITS = 20
+_KEY_MASK = (1 << _KEY_BITS) - 1
+
 # ---------- Maze and UI state ----------
-maze = [[WALL for _ in range(COLS)] for _ in range(ROWS)]
+maze = np.full((ROWS, COLS), WALL, dtype=np.uint8)
 start = (0, 0)
 end = (ROWS - 1, COLS - 1)
 placing_start = True  # toggles when user right-clicks first/second
@@ -48,70 +64,117 @@ canvas_width = COLS * CELL_SIZE
 canvas_height = ROWS * CELL_SIZE
 
 canvas = tk.Canvas(root, width=canvas_width, height=canvas_height, bg="white")
-canvas.grid(row=0, column=0, columnspan=6, padx=10, pady=10)
+canvas.grid(row=0, column=0, columnspan=7, padx=10, pady=10)
 
 # Speed slider label
 speed_var = tk.DoubleVar(value=0.01)
 
 # ---------- Utility functions ----------
-def in_bounds(r, c):
-    return 0 <= r < ROWS and 0 <= c < COLS
-
-def neighbors(r, c):
-    for dr, dc in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-        nr, nc = r + dr, c + dc
-        if in_bounds(nr, nc):
-            yield nr, nc
+def open_neighbors(r, c):
+    # open cells next to (r, c), right/down/left/up; edge checks written
+    # out inline since this runs for every expanded cell
+    out = []
+    if c < COLS-1 and maze[r, c+1] == PATH:
+        out.append((r, c+1))
+    if r < ROWS-1 and maze[r+1, c] == PATH:
+        out.append((r+1, c))
+    if c > 0 and maze[r, c-1] == PATH:
+        out.append((r, c-1))
+    if r > 0 and maze[r-1, c] == PATH:
+        out.append((r-1, c))
+    return out
 
 # ---------- Drawing ----------
-rect_ids = [[None]*COLS for _ in range(ROWS)]
+# The canvas shows a single image backed by an RGB pixel buffer. Cells are
+# painted into the buffer with NumPy and the image is uploaded once per
+# frame, instead of keeping one canvas rectangle per cell.
+COLOR_RGB = {
+    COLOR_PATH: (255, 255, 255),
+    COLOR_WALL: (0, 0, 0),
+    COLOR_START: (0, 128, 0),
+    COLOR_END: (255, 0, 0),
+    COLOR_VISITED: (173, 216, 230),
+    COLOR_FRONTIER: (0, 255, 255),
+    COLOR_FINAL_PATH: (255, 255, 0),
+}
+COLOR_GRID_RGB = (190, 190, 190)  # cell outline, Tk's "gray"
+
+pixels = np.zeros((canvas_height, canvas_width, 3), dtype=np.uint8)
+if ImageTk is not None:
+    maze_image = ImageTk.PhotoImage(Image.fromarray(pixels))
+else:
+    maze_image = tk.PhotoImage(width=canvas_width, height=canvas_height)
+canvas.create_image(0, 0, anchor="nw", image=maze_image)
+_dirty = []  # cells recolored since the last frame
+
+def _to_ppm(rgb):
+    h, w, _ = rgb.shape
+    return b"P6 %d %d 255\n" % (w, h) + rgb.tobytes()
+
+def blit():
+    # upload the pixel buffer to the canvas image
+    if ImageTk is not None:
+        maze_image.paste(Image.fromarray(pixels))
+    else:
+        maze_image.configure(data=_to_ppm(pixels), format="PPM")
 
 def draw_cell(r, c, color):
-    x1 = c * CELL_SIZE
-    y1 = r * CELL_SIZE
-    x2 = x1 + CELL_SIZE
-    y2 = y1 + CELL_SIZE
-    if rect_ids[r][c] is None:
-        rect_ids[r][c] = canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="gray")
-    else:
-        canvas.itemconfig(rect_ids[r][c], fill=color)
-    return rect_ids[r][c]
+    block = pixels[r*CELL_SIZE:(r+1)*CELL_SIZE, c*CELL_SIZE:(c+1)*CELL_SIZE]
+    block[...] = COLOR_RGB[color]
+    block[0, :] = COLOR_GRID_RGB
+    block[:, 0] = COLOR_GRID_RGB
+    _dirty.append((r, c))
 
 def draw_maze():
-    for r in range(ROWS):
-        for c in range(COLS):
-            if maze[r][c] == WALL:
-                draw_cell(r, c, COLOR_WALL)
-            else:
-                draw_cell(r, c, COLOR_PATH)
+    # paint the whole grid from the maze array in one go
+    rgb = np.where((maze == WALL)[..., None], COLOR_RGB[COLOR_WALL], COLOR_RGB[COLOR_PATH])
+    pixels[...] = rgb.astype(np.uint8).repeat(CELL_SIZE, axis=0).repeat(CELL_SIZE, axis=1)
+    pixels[::CELL_SIZE, :] = COLOR_GRID_RGB
+    pixels[:, ::CELL_SIZE] = COLOR_GRID_RGB
     sr, sc = start
     er, ec = end
     draw_cell(sr, sc, COLOR_START)
     draw_cell(er, ec, COLOR_END)
+    _dirty.clear()
+    blit()
 
 # ---------- Maze generation: Recursive Backtracker ----------
 def carve_maze():
     # Start with grid of walls, carve cells (odd indices) to make paths
     global maze
-    maze = [[WALL for _ in range(COLS)] for _ in range(ROWS)]
+    # carve on plain lists (faster per-cell access than ndarray scalars)
+    grid = [[WALL] * COLS for _ in range(ROWS)]
     # ensure odd rows/cols for cells when possible — but we just use backtracker that moves 2 steps
-    def carve_from(r, c):
-        maze[r][c] = PATH
+    def shuffled_dirs():
         dirs = [(0,2),(0,-2),(2,0),(-2,0)]
         random.shuffle(dirs)
-        for dr, dc in dirs:
-            nr, nc = r+dr, c+dc
-            if in_bounds(nr, nc) and maze[nr][nc] == WALL:
-                # remove wall between
-                maze[r + dr//2][c + dc//2] = PATH
-                carve_from(nr, nc)
+        return iter(dirs)
+    def carve_from(sr, sc):
+        # explicit stack instead of recursion (no frame per cell, no recursion
+        # limit); each entry keeps its cell's shuffled directions so a cell is
+        # shuffled once and resumes where it left off
+        grid[sr][sc] = PATH
+        stack = [(sr, sc, shuffled_dirs())]
+        while stack:
+            r, c, dirs = stack[-1]
+            for dr, dc in dirs:
+                nr, nc = r+dr, c+dc
+                if 0 <= nr < ROWS and 0 <= nc < COLS and grid[nr][nc] == WALL:
+                    # remove wall between
+                    grid[r + dr//2][c + dc//2] = PATH
+                    grid[nr][nc] = PATH
+                    stack.append((nr, nc, shuffled_dirs()))
+                    break
+            else:
+                stack.pop()
     # choose a random starting cell with odd coordinates (if possible)
     sr = random.randrange(0, ROWS, 2)
     sc = random.randrange(0, COLS, 2)
     carve_from(sr, sc)
+    maze = np.array(grid, dtype=np.uint8)
     # Ensure start and end are path
-    maze[start[0]][start[1]] = PATH
-    maze[end[0]][end[1]] = PATH
+    maze[start] = PATH
+    maze[end] = PATH
     draw_maze()
 
 # ---------- Mouse interactions ----------
@@ -120,12 +183,12 @@ def toggle_wall(event):
         return
     c = event.x // CELL_SIZE
     r = event.y // CELL_SIZE
-    if not in_bounds(r, c):
+    if not (0 <= r < ROWS and 0 <= c < COLS):
         return
     # left click toggles wall/path, but don't override start/end
     if (r, c) == start or (r, c) == end:
         return
-    maze[r][c] = PATH if maze[r][c] == WALL else WALL
+    maze[r, c] = PATH if maze[r, c] == WALL else WALL
     draw_maze()
 
 def set_start_end(event):
@@ -135,14 +198,14 @@ def set_start_end(event):
         return
     c = event.x // CELL_SIZE
     r = event.y // CELL_SIZE
-    if not in_bounds(r, c):
+    if not (0 <= r < ROWS and 0 <= c < COLS):
         return
     if placing_start:
         # make sure not placing on wall
-        maze[r][c] = PATH
+        maze[r, c] = PATH
         start = (r, c)
     else:
-        maze[r][c] = PATH
+        maze[r, c] = PATH
         end = (r, c)
     placing_start = not placing_start
     draw_maze()
@@ -151,13 +214,51 @@ canvas.bind("<Button-1>", toggle_wall)  # left click
 canvas.bind("<Button-3>", set_start_end)  # right click (set start/end)
 
 # ---------- Search algorithms (animated) ----------
-def animate_delay():
-    # small delay controlled by slider
-    d = speed_var.get()
-    root.update()
-    time.sleep(d)
+# Searches are generators that yield after each step. run_animation()
+# drives them from the Tk event loop with root.after, so the window keeps
+# handling input while a search is animating.
+cancel_requested = False
+
+def run_animation(steps):
+    global animating, cancel_requested
+    if animating:
+        return
+    animating = True
+    cancel_requested = False
+    _dirty.clear()
+    _tick(steps)
+
+def _tick(steps):
+    # Advance until a frame's worth of cells or time (including the
+    # slider's per-step delay) has built up, then let Tk redraw once and
+    # come back after that delay.
+    global animating
+    delay = 0.0
+    frame_start = time.perf_counter()
+    try:
+        while not cancel_requested:
+            next(steps)
+            delay += speed_var.get()
+            if len(_dirty) >= FRAME_BATCH or delay >= FRAME_TIME \
+                    or time.perf_counter() - frame_start >= FRAME_TIME:
+                break
+    except StopIteration:
+        pass
+    else:
+        if not cancel_requested:
+            _dirty.clear()
+            blit()
+            root.after(max(1, int(delay * 1000)), _tick, steps)
+            return
+    _dirty.clear()
+    blit()
+    animating = False
+
+def on_stop():
+    global cancel_requested
+    cancel_requested = True
 
-def reconstruct_and_draw(parent, finish):
+def reconstruct_steps(parent, finish):
     # Reconstruct path from finish to start using parent dict {node: parent}
     node = finish
     path = []
@@ -169,15 +270,11 @@ def reconstruct_and_draw(parent, finish):
         if (r, c) == start or (r, c) == end:
             continue
         draw_cell(r, c, COLOR_FINAL_PATH)
-        animate_delay()
+        yield
     draw_cell(start[0], start[1], COLOR_START)
     draw_cell(end[0], end[1], COLOR_END)
 
-def bfs_solve():
-    global animating
-    if animating:
-        return
-    animating = True
+def bfs_steps():
     sr, sc = start
     er, ec = end
     visited = set()
@@ -186,64 +283,63 @@ def bfs_solve():
     q.append((sr, sc))
     visited.add((sr, sc))
     found = False
+    # hoist attribute lookups out of the loop
+    popleft, append = q.popleft, q.append
+    seen = visited.add
 
     while q:
-        r, c = q.popleft()
+        r, c = popleft()
         # draw as visited
         if (r, c) != start and (r, c) != end:
             draw_cell(r, c, COLOR_VISITED)
-        animate_delay()
+        yield
         if (r, c) == (er, ec):
             found = True
             break
-        for nr, nc in neighbors(r, c):
-            if maze[nr][nc] == WALL:
-                continue
+        for nr, nc in open_neighbors(r, c):
             if (nr, nc) in visited:
                 continue
-            visited.add((nr, nc))
+            seen((nr, nc))
             parent[(nr, nc)] = (r, c)
-            q.append((nr, nc))
+            append((nr, nc))
             # optionally draw frontier
             if (nr, nc) != end:
                 draw_cell(nr, nc, COLOR_FRONTIER)
-        animate_delay()
+        yield
 
     if found:
-        reconstruct_and_draw(parent, (er, ec))
+        yield from reconstruct_steps(parent, (er, ec))
     else:
-        tk.messagebox.showinfo("Result", "No path found.")
-    animating = False
+        messagebox.showinfo("Result", "No path found.")
 
 def manhattan(a, b):
     return abs(a[0]-b[0]) + abs(a[1]-b[1])
 
-def astar_solve():
-    global animating
-    if animating:
-        return
-    animating = True
+def astar_steps():
     sr, sc = start
     er, ec = end
     start_node = (sr, sc)
     goal = (er, ec)
 
     gscore = {start_node: 0}
-    fscore = {start_node: manhattan(start_node, goal)}
     parent = {}
+    # hoist globals/attributes used in the hot loop into locals
+    push, pop = heapq.heappush, heapq.heappop
+    inf = float('inf')
 
     open_heap = []
-    heapq.heappush(open_heap, (fscore[start_node], start_node))
+    h = manhattan(start_node, goal)
+    push(open_heap, (h << 2*_KEY_BITS) | (h << _KEY_BITS) | (sr*COLS + sc))
     open_set = {start_node}
     closed = set()
     found = False
 
     while open_heap:
-        _, current = heapq.heappop(open_heap)
+        r, c = divmod(pop(open_heap) & _KEY_MASK, COLS)
+        current = (r, c)
         open_set.discard(current)
         if current in closed:
             continue
-        r, c = current
 
         if current == goal:
             found = True
@@ -253,31 +349,35 @@ def astar_solve():
         # mark visited
         if current != start and current != end:
             draw_cell(r, c, COLOR_VISITED)
-        animate_delay()
+        yield
 
-        for nr, nc in neighbors(r, c):
-            if maze[nr][nc] == WALL:
-                continue
-            tentative_g = gscore[current] + 1
+        tentative_g = gscore[current] + 1
+        for nr, nc in open_neighbors(r, c):
             neighbor = (nr, nc)
-            if neighbor in closed and tentative_g >= gscore.get(neighbor, float('inf')):
+            if neighbor in closed and tentative_g >= gscore.get(neighbor, inf):
                 continue
-            if tentative_g < gscore.get(neighbor, float('inf')):
+            if tentative_g < gscore.get(neighbor, inf):
                 parent[neighbor] = current
                 gscore[neighbor] = tentative_g
-                fscore[neighbor] = tentative_g + manhattan(neighbor, goal)
+                # manhattan() inlined
+                h = abs(nr - er) + abs(nc - ec)
                 if neighbor not in open_set:
-                    heapq.heappush(open_heap, (fscore[neighbor], neighbor))
+                    push(open_heap, ((tentative_g + h) << 2*_KEY_BITS) | (h << _KEY_BITS) | (nr*COLS + nc))
                     open_set.add(neighbor)
                     if neighbor != end:
                         draw_cell(nr, nc, COLOR_FRONTIER)
-        animate_delay()
+        yield
 
     if found:
-        reconstruct_and_draw(parent, goal)
+        yield from reconstruct_steps(parent, goal)
     else:
-        tk.messagebox.showinfo("Result", "No path found.")
-    animating = False
+        messagebox.showinfo("Result", "No path found.")
+
+def bfs_solve():
+    run_animation(bfs_steps())
+
+def astar_solve():
+    run_animation(astar_steps())
 
 # ---------- Controls ----------
 def on_generate():
@@ -289,26 +389,16 @@ def clear_paths():
     if animating:
         return
     # redraw maze cells leaving walls in place, reset any visited/path colors
-    for r in range(ROWS):
-        for c in range(COLS):
-            if maze[r][c] == WALL:
-                draw_cell(r, c, COLOR_WALL)
-            else:
-                draw_cell(r, c, COLOR_PATH)
-    draw_cell(start[0], start[1], COLOR_START)
-    draw_cell(end[0], end[1], COLOR_END)
+    draw_maze()
 
 def reset_maze_empty():
     if animating:
         return
-    for r in range(ROWS):
-        for c in range(COLS):
-            maze[r][c] = PATH
+    maze[:, :] = PATH
     # set border walls if you want — keep open
     draw_maze()
 
 def on_bfs():
-    # run BFS in a non-blocking way? we run it directly (with small sleeps), UI remains responsive enough
     clear_paths()
     root.update()
     bfs_solve()
@@ -343,6 +433,9 @@ btn_reset.grid(row=1, column=4, padx=4)
 btn_empty = ttk.Button(root, text="Empty Maze", command=reset_maze_empty)
 btn_empty.grid(row=1, column=5, padx=4)
 
+btn_stop = ttk.Button(root, text="Stop", command=on_stop)
+btn_stop.grid(row=1, column=6, padx=4)
+
 # Speed slider
 tk.Label(root, text="Animation speed (s)").grid(row=2, column=0, pady=(0,10))
 speed_slider = tk.Scale(root, variable=speed_var, from_=0.0, to=0.15, orient="horizontal", resolution=0.005, length=200)
@@ -355,7 +448,7 @@ instr_text = (
     "Generate -> Solve (BFS/A*)."
 )
 instr_label = tk.Label(root, text=instr_text, justify="left")
-instr_label.grid(row=2, column=3, columnspan=3, sticky="w")
+instr_label.grid(row=2, column=3, columnspan=4, sticky="w")
 
 # ---------- Initialize ----------
 carve_maze()
@@ -7,13 +7,17 @@ const algoSelect = document.getElementById("algoSelect");
 const speedRange = document.getElementById("speedRange");
 
 let maze = [];
+let mazeId = null; // server-side cache key for the current maze
 let cellSize = 20; // adjusted to fit; will be recalculated for large screens
-let explored = [];
-let path = [];
+// cells come back from /solve as parallel row/column arrays
+let explored = { r: [], c: [] };
+let path = { r: [], c: [] };
 
 async function generateMaze() {
   const res = await fetch("/generate");
-  maze = await res.json();
+  const data = await res.json();
+  maze = data.maze;
+  mazeId = data.id;
   adjustCellSizeAndCanvas();
   drawMaze();
 }
@@ -49,17 +53,22 @@ async function solveMaze() {
   const end = [maze.length - 1, maze[0].length - 1];
   const algo = algoSelect.value;
 
-  // send to backend
-  const res = await fetch("/solve", {
+  // send to backend; the server already has the maze cached under its id
+  const post = body => fetch("/solve", {
     method: "POST",
     headers: { "Content-Type": "application/json" },
-    body: JSON.stringify({ maze, start, end, algo })
+    body: JSON.stringify(body)
   });
+  let res = await post({ maze_id: mazeId, start, end, algo });
+  if (res.status === 404) {
+    // evicted or served by another worker: send the grid itself
+    res = await post({ maze, start, end, algo });
+  }
   const data = await res.json();
-  explored = data.explored || [];
-  path = data.path || [];
+  explored = { r: data.explored_r || [], c: data.explored_c || [] };
+  path = { r: data.path_r || [], c: data.path_c || [] };
 
-  if ((!path || path.length === 0) && (!explored || explored.length === 0)) {
+  if (path.r.length === 0 && explored.r.length === 0) {
     alert("No path found and no exploration returned.");
     return;
   }
@@ -75,8 +84,8 @@ async function animateExplorationThenPath() {
   drawMaze();
   const delay = parseInt(speedRange.value); // ms
   // draw exploration (lighter color)
-  for (let i = 0; i < explored.length; i++) {
-    const [r, c] = explored[i];
+  for (let i = 0; i < explored.r.length; i++) {
+    const r = explored.r[i], c = explored.c[i];
     // skip start & end
     if ((r === 0 && c === 0) || (r === maze.length-1 && c === maze[0].length-1)) continue;
     ctx.fillStyle = "#a0d2ff"; // exploration color
@@ -88,8 +97,8 @@ async function animateExplorationThenPath() {
   await sleep(Math.max(60, delay));
 
   // draw final path (highlight)
-  for (let i = 0; i < path.length; i++) {
-    const [r, c] = path[i];
+  for (let i = 0; i < path.r.length; i++) {
+    const r = path.r[i], c = path.c[i];
     if ((r === 0 && c === 0) || (r === maze.length-1 && c === maze[0].length-1)) continue;
     ctx.fillStyle = "#ffd166"; // final path color
     ctx.fillRect(c * cellSize, r * cellSize, cellSize, cellSize);
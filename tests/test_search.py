@@ -0,0 +1,107 @@
+import asyncio
+import random
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import app
+
+
+def random_grid(rng, rows, cols, density):
+    maze = (rng.random((rows, cols)) < density).astype(np.uint8)
+    maze[0, 0] = maze[-1, -1] = app.PATH
+    return maze
+
+
+class ShortestPathTest(unittest.TestCase):
+    # A* and bidirectional A* must return paths as short as BFS's; for the
+    # bidirectional search that is what its 2*mu stopping rule guarantees.
+
+    def mazes(self):
+        rng = np.random.default_rng(0)
+        for seed in range(10):
+            random.seed(seed)
+            yield app.generate_maze()
+        for density in (0.0, 0.2, 0.35):
+            for _ in range(5):
+                yield random_grid(rng, 30, 40, density)
+            # wider than one 64-bit word, so the bitset BFS carries
+            # east/west moves across words
+            yield random_grid(rng, 20, 150, density)
+
+    def assert_valid_path(self, maze, path, start, end):
+        cells = [divmod(int(i), maze.shape[1]) for i in path]
+        self.assertEqual(cells[0], start)
+        self.assertEqual(cells[-1], end)
+        for (r1, c1), (r2, c2) in zip(cells, cells[1:]):
+            self.assertEqual(abs(r1 - r2) + abs(c1 - c2), 1)
+        for cell in cells:
+            self.assertEqual(maze[cell], app.PATH)
+
+    def check_searches(self):
+        for maze in self.mazes():
+            start, end = (0, 0), (maze.shape[0] - 1, maze.shape[1] - 1)
+            _, bfs_path = app.bfs_with_exploration(maze, start, end)
+            for search in (app.astar_with_exploration,
+                           app.bidirectional_astar_with_exploration,
+                           lambda m, s, e: app.bfs_with_exploration(m, s, e, bitset=True)):
+                _, path = search(maze, start, end)
+                self.assertEqual(len(path), len(bfs_path), search.__name__)
+                if len(path):
+                    self.assert_valid_path(maze, path, start, end)
+
+    def test_matches_bfs_distance(self):
+        self.check_searches()
+
+    def test_matches_bfs_distance_without_numba(self):
+        with mock.patch.object(app, "HAVE_NUMBA", False):
+            self.check_searches()
+
+    def test_start_is_end(self):
+        maze = np.zeros((5, 5), dtype=np.uint8)
+        for search in (app.bfs_with_exploration, app.astar_with_exploration,
+                       app.bidirectional_astar_with_exploration):
+            _, path = search(maze, (2, 2), (2, 2))
+            self.assertEqual(path.tolist(), [12])
+
+    def test_rejects_out_of_range_endpoints(self):
+        maze = np.zeros((25, 35), dtype=np.uint8)
+        bad = [((0, 0), (100, 100)), ((0, 0), (30, 40)), ((0, 0), (-1, -1)),
+               ((0, 0), (25, 0)), ((0, 35), (24, 34))]
+        for numba in (app.HAVE_NUMBA, False):
+            with mock.patch.object(app, "HAVE_NUMBA", numba):
+                for search in (app.bfs_with_exploration, app.astar_with_exploration,
+                               app.bidirectional_astar_with_exploration):
+                    for start, end in bad:
+                        with self.assertRaises(ValueError):
+                            search(maze, start, end)
+
+
+class SolveRouteTest(unittest.TestCase):
+
+    def post_solve(self, payload):
+        async def run():
+            client = app.app.test_client()
+            response = await client.post("/solve", json=payload)
+            return response.status_code, await response.get_json()
+        return asyncio.run(run())
+
+    def test_out_of_range_end_is_bad_request(self):
+        maze_id = app.cache_maze(np.zeros((25, 35), dtype=np.uint8))
+        for algo in ("bfs", "astar", "bidir"):
+            status, body = self.post_solve(
+                {"maze_id": maze_id, "end": [100, 100], "algo": algo})
+            self.assertEqual(status, 400, algo)
+            self.assertIn("error", body)
+
+    def test_wide_grid_coordinates_do_not_wrap(self):
+        maze = np.zeros((1, 40000), dtype=np.uint8)
+        status, body = self.post_solve({"maze": maze.tolist(), "algo": "bfs"})
+        self.assertEqual(status, 200)
+        self.assertEqual(body["path_c"][-1], 39999)
+        self.assertEqual(min(body["path_c"]), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()